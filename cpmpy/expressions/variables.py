@@ -319,8 +319,14 @@ class _NumVarImpl(Expression):
         return self.name
 
     # for sets/dicts. Because names are unique, so is the str repr
+    # the hash is cached, variables are used as dict keys on hot paths
+    # (e.g. a solver's _varmap) and their name never changes
     def __hash__(self):
-        return hash(self.name)
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self.name)
+            return self._hash
 
 
 class _IntVarImpl(_NumVarImpl):
@@ -382,7 +388,11 @@ class _BoolVarImpl(_IntVarImpl):
     # when redefining __eq__, must redefine custom__hash__
     # https://stackoverflow.com/questions/53518981/inheritance-hash-sets-to-none-in-a-subclass
     def __hash__(self):
-        return hash(self.name)
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self.name)
+            return self._hash
 
 
 class NegBoolView(_BoolVarImpl):
@@ -57,15 +57,16 @@
         param_combinations
 """
 
-from .utils import builtin_solvers, get_supported_solvers, param_combinations
-from .ortools import CPM_ortools
-from .pysat import CPM_pysat
-from .minizinc import CPM_minizinc
-from .gurobi import  CPM_gurobi
-from .pysdd import CPM_pysdd
-from .z3 import CPM_z3
-from .exact import CPM_exact
-from .choco import CPM_choco
-from .gcs import CPM_gcs
-from .cpo import CPM_cpo
+from .utils import get_supported_solvers, param_combinations
+
+
+def __getattr__(name):
+    # forward `builtin_solvers` and the `CPM_*` solver classes to `.utils`,
+    # which imports the solver interface modules lazily (see there)
+    if name == "builtin_solvers" or name.startswith("CPM_"):
+        from . import utils
+        value = getattr(utils, name)
+        globals()[name] = value  # cache, next access skips this hook
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
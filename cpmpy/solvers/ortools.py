@@ -44,6 +44,8 @@
     ==============
 """
 import sys  # for stdout checking
+import time
+import operator
 import numpy as np
 
 from .solver_interface import SolverInterface, SolverStatus, ExitStatus
@@ -52,7 +54,7 @@ from ..expressions.core import Expression, Comparison, Operator, BoolVal
 from ..expressions.globalconstraints import DirectConstraint
 from ..expressions.variables import _NumVarImpl, _IntVarImpl, _BoolVarImpl, NegBoolView, boolvar, intvar
 from ..expressions.globalconstraints import GlobalConstraint
-from ..expressions.utils import is_num, is_int, eval_comparison, flatlist, argval, argvals, get_bounds
+from ..expressions.utils import is_num, is_int, flatlist, argval, argvals, get_bounds
 from ..transformations.decompose_global import decompose_in_tree
 from ..transformations.get_variables import get_variables
 from ..transformations.flatten_model import flatten_constraint, flatten_objective, get_or_make_var
@@ -61,6 +63,55 @@ from ..transformations.reification import only_implies, reify_rewrite, only_bv_r
 from ..transformations.comparison import only_numexpr_equality
 from ..transformations.safening import no_partial_functions
 
+# solvers are optional, so this file should be interpretable
+# even if ortools is not installed...
+# import it once here, so methods called in tight loops (e.g. repeated solves)
+# do not pay the import-machinery overhead on every call
+try:
+    from ortools.sat.python import cp_model as ort
+except ImportError:
+    ort = None
+
+# comparison dispatch table: one dict load + C-level operator call per posted
+# comparison, instead of the string-based dispatch inside eval_comparison
+_ORT_CMP = {"==": operator.eq, "!=": operator.ne, "<=": operator.le,
+            "<": operator.lt, ">=": operator.ge, ">": operator.gt}
+
+# constant sets used by transform(), built once instead of per call
+_SAFEN = frozenset({"div", "mod"})
+
+# hyperparameter (tuning) spaces, built once; tuning frameworks query these in their search loops
+_TUNABLE_PARAMS = {
+    # 'use_branching_in_lp': [False, True], # removed in OR-tools >= v9.9
+    'optimize_with_core' : [False, True],
+    'search_branching': [0,1,2,3,4,5,6],
+    'boolean_encoding_level' : [0,1,2,3],
+    'linearization_level': [0, 1, 2],
+    'core_minimization_level' : [0,1,2], # new in OR-tools>= v9.8
+    'cp_model_probing_level': [0, 1, 2, 3],
+    'cp_model_presolve' : [False, True],
+    'clause_cleanup_ordering' : [0,1],
+    'binary_minimization_algorithm' : [0,1,2,3,4],
+    'minimization_algorithm' : [0,1,2,3],
+    'use_phase_saving' : [False, True]
+}
+_DEFAULT_PARAMS = {
+    # 'use_branching_in_lp': False, # removed in OR-tools >= v9.9
+    'optimize_with_core': False,
+    'search_branching': 0,
+    'boolean_encoding_level': 1,
+    'linearization_level': 1,
+    'core_minimization_level': 2,# new in OR-tools>=v9.8
+    'cp_model_probing_level': 2,
+    'cp_model_presolve': True,
+    'clause_cleanup_ordering': 0,
+    'binary_minimization_algorithm': 1,
+    'minimization_algorithm': 2,
+    'use_phase_saving': True
+}
+_REIF_SUPPORTED = frozenset({"sum", "wsum"})
+_EQ_SUPPORTED = frozenset({"sum", "wsum", "sub"})
+
 
 class CPM_ortools(SolverInterface):
     """
@@ -77,16 +128,14 @@ class CPM_ortools(SolverInterface):
     https://developers.google.com/optimization/reference/python/sat/python/cp_model
     """
 
+    # global constraints the transformations should keep (see transform())
+    _SUPPORTED = frozenset({"min", "max", "abs", "element", "alldifferent", "xor", "table",
+                            "negative_table", "cumulative", "circuit", "inverse", "no_overlap", "regular"})
+
     @staticmethod
     def supported():
-        # try to import the package
-        try:
-            import ortools
-            return True
-        except ModuleNotFoundError:
-            return False
-        except Exception as e:
-            raise e
+        # package imported at module load time (if present)
+        return ort is not None
 
 
     def __init__(self, cpm_model=None, subsolver=None):
@@ -106,8 +155,6 @@ class CPM_ortools(SolverInterface):
         if not self.supported():
             raise Exception("CPM_ortools: Install the python package 'ortools' to use this solver interface.")
 
-        from ortools.sat.python import cp_model as ort
-
         assert(subsolver is None)
 
         # initialise the native solver objects
@@ -117,6 +164,21 @@ class CPM_ortools(SolverInterface):
         # for solving with assumption variables,
         # need to store mapping from ORTools Index to CPMpy variable
         self.assumption_dict = None
+        # the assumption indices posted last, to skip re-posting unchanged ones
+        self._last_assum_ids = None
+
+        # whether a 'False' constraint (empty clause) has already been posted
+        self._false_posted = False
+
+        # whether an objective function has been posted (through objective())
+        self._has_obj = False
+
+        # cache of ortools constants for integer constants used as variables,
+        # so repeated posts reuse one NewConstant instead of creating duplicates
+        self._intconst_cache = dict()
+
+        # cache of mapped arrays for element constraints, keyed by element ids
+        self._elemarr_cache = dict()
 
         # initialise everything else and post the constraints/objective
         super().__init__(name="ortools", cpm_model=cpm_model)
@@ -170,7 +232,6 @@ class CPM_ortools(SolverInterface):
                     o.solve(num_search_workers=8, log_search_progress=True)
 
         """
-        from ortools.sat.python import cp_model as ort
         # ensure all user vars are known to solver
         self.solver_vars(list(self.user_vars))
 
@@ -182,10 +243,13 @@ class CPM_ortools(SolverInterface):
 
         if assumptions is not None:
             ort_assum_vars = self.solver_vars(assumptions)
+            assum_ids = [ort_var.Index() for ort_var in ort_assum_vars]
             # dict mapping ortools vars to CPMpy vars
-            self.assumption_dict = {ort_var.Index(): cpm_var for (cpm_var, ort_var) in zip(assumptions, ort_assum_vars)}
-            self.ort_model.ClearAssumptions()  # because add just appends
-            self.ort_model.AddAssumptions(ort_assum_vars)
+            self.assumption_dict = dict(zip(assum_ids, assumptions))
+            if assum_ids != self._last_assum_ids:  # only re-post on change
+                self.ort_model.ClearAssumptions()  # because add just appends
+                self.ort_model.AddAssumptions(ort_assum_vars)
+                self._last_assum_ids = assum_ids
             # workaround for a presolve with assumptions bug in ortools
             # https://github.com/google/or-tools/issues/2649
             # still present in v9.0
@@ -241,15 +305,17 @@ class CPM_ortools(SolverInterface):
         # translate solution values (of user specified variables only)
         self.objective_value_ = None
         if has_sol:
-            # fill in variable values
+            # fill in variable values, from one batched read of the response proto
+            # (avoids a Value() call into the solver wrapper per variable)
+            sol = self.ort_solver.ResponseProto().solution
+            nsol = len(sol)
             for cpm_var in self.user_vars:
-                try:
-                    cpm_var._value = self.ort_solver.Value(self.solver_var(cpm_var))
-                    if isinstance(cpm_var, _BoolVarImpl):
-                        cpm_var._value = bool(cpm_var._value) # ort value is always an int
-                except IndexError:
+                idx = self.solver_var(cpm_var).Index()
+                if idx >= nsol:
                     raise ValueError(f"Var {cpm_var} is unknown to the OR-Tools solver, this is unexpected - "
                                      f"please report on github...")
+                value = sol[idx]
+                cpm_var._value = bool(value) if isinstance(cpm_var, _BoolVarImpl) else value
 
             # translate objective
             if self.has_objective():
@@ -302,15 +368,51 @@ class CPM_ortools(SolverInterface):
         # create if it does not exist
         if cpm_var not in self._varmap:
             if isinstance(cpm_var, _BoolVarImpl):
-                revar = self.ort_model.NewBoolVar(str(cpm_var))
+                revar = self.ort_model.NewBoolVar(cpm_var.name)
             elif isinstance(cpm_var, _IntVarImpl):
-                revar = self.ort_model.NewIntVar(cpm_var.lb, cpm_var.ub, str(cpm_var))
+                revar = self.ort_model.NewIntVar(cpm_var.lb, cpm_var.ub, cpm_var.name)
             else:
                 raise NotImplementedError("Not a known var {}".format(cpm_var))
             self._varmap[cpm_var] = revar
 
         return self._varmap[cpm_var]
 
+    def _get_constant(self, value):
+        """
+            Returns a (cached) ortools constant 'variable' for an integer constant,
+            for the few places where OR-Tools requires a variable argument
+        """
+        ort_const = self._intconst_cache.get(value)
+        if ort_const is None:
+            ort_const = self._intconst_cache[value] = self.ort_model.NewConstant(int(value))
+        return ort_const
+
+    @staticmethod
+    def _fill_linexpr(field, arg):
+        """
+            Write an ortools variable or integer constant into a
+            LinearExpressionProto field of the model proto
+        """
+        if is_int(arg):
+            field.offset = int(arg)
+        else:
+            field.vars.append(arg.Index())
+            field.coeffs.append(1)
+
+    def _add_interval(self, start, size, end):
+        """
+            Add an interval constraint directly to the model proto and return
+            its index (the form cumulative/no_overlap protos refer to them by),
+            skipping the NewIntervalVar Python wrapper
+        """
+        proto = self.ort_model.Proto()
+        index = len(proto.constraints)
+        ct = proto.constraints.add()
+        self._fill_linexpr(ct.interval.start, start)
+        self._fill_linexpr(ct.interval.size, size)
+        self._fill_linexpr(ct.interval.end, end)
+        return index
+
 
     def objective(self, expr, minimize):
         """
@@ -325,10 +427,9 @@ class CPM_ortools(SolverInterface):
                 technical side note: any constraints created during conversion of the objective
                 are premanently posted to the solver
         """
-        # make objective function non-nested
-        (flat_obj, flat_cons) = flatten_objective(expr)
+        # make objective function non-nested, collect objvars into user_vars
+        (flat_obj, flat_cons) = flatten_objective(expr, collect=self.user_vars)
         self += flat_cons  # add potentially created constraints
-        get_variables(flat_obj, collect=self.user_vars)  # add objvars to vars
 
         # make objective function or variable and post
         obj = self._make_numexpr(flat_obj)
@@ -336,9 +437,11 @@ class CPM_ortools(SolverInterface):
             self.ort_model.Minimize(obj)
         else:
             self.ort_model.Maximize(obj)
+        self._has_obj = True
 
     def has_objective(self):
-        return self.ort_model.HasObjective()
+        # tracked flag, avoids the proto inspection of ort_model.HasObjective()
+        return self._has_obj
 
     def _make_numexpr(self, cpm_expr):
         """
@@ -362,13 +465,26 @@ class CPM_ortools(SolverInterface):
         # sum or weighted sum
         if isinstance(cpm_expr, Operator):
             if cpm_expr.name == 'sum':
-                return ort.LinearExpr.sum(self.solver_vars(cpm_expr.args))
+                ort_args = self.solver_vars(cpm_expr.args)
+                if len(ort_args) <= 3:
+                    # tiny sums are common after flattening; plain Python '+'
+                    # is cheaper than the LinearExpr.sum factory
+                    out = ort_args[0] if ort_args else 0
+                    for a in ort_args[1:]:
+                        out = out + a
+                    return out
+                return ort.LinearExpr.sum(ort_args)
             elif cpm_expr.name == "sub":
                 a,b = self.solver_vars(cpm_expr.args)
                 return a - b
             elif cpm_expr.name == 'wsum':
                 w = cpm_expr.args[0]
                 x = self.solver_vars(cpm_expr.args[1])
+                if len(x) <= 2:
+                    out = w[0] * x[0] if x else 0
+                    for wi, xi in zip(w[1:], x[1:]):
+                        out = out + wi * xi
+                    return out
                 return ort.LinearExpr.weighted_sum(x,w)
 
         raise NotImplementedError("ORTools: Not a known supported numexpr {}".format(cpm_expr))
@@ -389,12 +505,11 @@ class CPM_ortools(SolverInterface):
             :return: list of Expression
         """
         cpm_cons = toplevel_list(cpm_expr)
-        supported = {"min", "max", "abs", "element", "alldifferent", "xor", "table", "negative_table", "cumulative", "circuit", "inverse", "no_overlap", "regular"}
-        cpm_cons = no_partial_functions(cpm_cons, safen_toplevel=frozenset({"div", "mod"})) # before decompose, assumes total decomposition for partial functions
-        cpm_cons = decompose_in_tree(cpm_cons, supported, csemap=self._csemap)
+        cpm_cons = no_partial_functions(cpm_cons, safen_toplevel=_SAFEN) # before decompose, assumes total decomposition for partial functions
+        cpm_cons = decompose_in_tree(cpm_cons, self._SUPPORTED, csemap=self._csemap)
         cpm_cons = flatten_constraint(cpm_cons, csemap=self._csemap)  # flat normal form
-        cpm_cons = reify_rewrite(cpm_cons, supported=frozenset(['sum', 'wsum']), csemap=self._csemap)  # constraints that support reification
-        cpm_cons = only_numexpr_equality(cpm_cons, supported=frozenset(["sum", "wsum", "sub"]), csemap=self._csemap)  # supports >, <, !=
+        cpm_cons = reify_rewrite(cpm_cons, supported=_REIF_SUPPORTED, csemap=self._csemap)  # constraints that support reification
+        cpm_cons = only_numexpr_equality(cpm_cons, supported=_EQ_SUPPORTED, csemap=self._csemap)  # supports >, <, !=
         cpm_cons = only_bv_reifies(cpm_cons, csemap=self._csemap)
         cpm_cons = only_implies(cpm_cons, csemap=self._csemap)  # everything that can create
                                              # reified expr must go before this
@@ -418,16 +533,93 @@ class CPM_ortools(SolverInterface):
 
             :return: self
         """
+        # normalize to a flat list once, so the variable walk and the
+        # transformation pipeline share it (instead of each unravelling
+        # the raw nested input separately)
+        cpm_cons = toplevel_list(cpm_expr)
+
         # add new user vars to the set
-        get_variables(cpm_expr, collect=self.user_vars)
+        get_variables(cpm_cons, collect=self.user_vars)
 
         # transform and post the constraints
-        for con in self.transform(cpm_expr):
+        for con in self.transform(cpm_cons):
             self._post_constraint(con)
 
         return self
     __add__ = add  # avoid redirect in superclass
 
+    def _post_linear_direct(self, cmp_name, lhs, rhs):
+        """
+            Write a linear comparison `lhs <cmp_name> rhs` (lhs a sum/wsum/sub
+            Operator) directly into the CpModel proto, bypassing the Python
+            expression wrappers of the `Add()` API; a large constant factor
+            cheaper when posting many linear constraints.
+
+            Returns True if posted; False when an argument does not fit
+            (non-integer data), the caller then falls back to the generic path.
+        """
+        offset = 0
+        acc = dict()  # ortools var index -> coefficient, coalesces duplicates
+        if lhs.name == 'sum':
+            items = ((a, 1) for a in lhs.args)
+        elif lhs.name == 'wsum':
+            items = zip(lhs.args[1], lhs.args[0])
+        else:  # 'sub'
+            items = zip(lhs.args, (1, -1))
+
+        for a, w in items:
+            if not is_int(w):
+                return False  # float weight, generic path handles (e.g. objective)
+            w = int(w)
+            if isinstance(a, NegBoolView):  # w*(1-bv)
+                idx = self.solver_var(a._bv).Index()
+                offset += w
+                w = -w
+            elif isinstance(a, _NumVarImpl):
+                idx = self.solver_var(a).Index()
+            elif is_int(a):
+                offset += w * int(a)
+                continue
+            else:
+                return False
+            acc[idx] = acc.get(idx, 0) + w
+
+        # move a variable rhs to the lhs, so the rhs is a constant
+        if isinstance(rhs, NegBoolView):  # lhs cmp 1-bv  <=>  lhs+bv cmp 1
+            idx = self.solver_var(rhs._bv).Index()
+            acc[idx] = acc.get(idx, 0) + 1
+            rhs_c = 1 - offset
+        elif isinstance(rhs, _NumVarImpl):
+            idx = self.solver_var(rhs).Index()
+            acc[idx] = acc.get(idx, 0) - 1
+            rhs_c = -offset
+        elif is_int(rhs):
+            rhs_c = int(rhs) - offset
+        else:
+            return False
+
+        if len(acc) == 0:
+            return False  # fully constant comparison, let the generic path fold it
+
+        if cmp_name == '==':
+            domain = (rhs_c, rhs_c)
+        elif cmp_name == '<=':
+            domain = (ort.INT_MIN, rhs_c)
+        elif cmp_name == '<':
+            domain = (ort.INT_MIN, rhs_c-1)
+        elif cmp_name == '>=':
+            domain = (rhs_c, ort.INT_MAX)
+        elif cmp_name == '>':
+            domain = (rhs_c+1, ort.INT_MAX)
+        else:  # '!='
+            domain = (ort.INT_MIN, rhs_c-1, rhs_c+1, ort.INT_MAX)
+
+        ct = self.ort_model.Proto().constraints.add()
+        ct.linear.vars.extend(acc.keys())
+        ct.linear.coeffs.extend(acc.values())
+        ct.linear.domain.extend(domain)
+        return True
+
     # TODO: 'reifiable' is an artefact from the early days
     # only 3 constraints support it (and,or,sum),
     # we can just add reified support for those and not need `reifiable` or returning the constraint
@@ -476,16 +668,23 @@ class CPM_ortools(SolverInterface):
         # numexpr `comp` bvar|const
         elif isinstance(cpm_expr, Comparison):
             lhs = cpm_expr.args[0]
+
+            # fast path: write linear comparisons straight into the proto
+            # (not when reified, the caller then needs the Constraint wrapper)
+            if not reifiable and isinstance(lhs, Operator) and lhs.name in ('sum', 'wsum', 'sub'):
+                if self._post_linear_direct(cpm_expr.name, lhs, cpm_expr.args[1]):
+                    return None
+
             ortrhs = self.solver_var(cpm_expr.args[1])
 
             if isinstance(lhs, _NumVarImpl):
                 # both are variables, do python comparison over ORT variables
-                return self.ort_model.Add(eval_comparison(cpm_expr.name, self.solver_var(lhs), ortrhs))
+                return self.ort_model.Add(_ORT_CMP[cpm_expr.name](self.solver_var(lhs), ortrhs))
             elif isinstance(lhs, Operator) and (lhs.name == 'sum' or lhs.name == 'wsum' or lhs.name == "sub"):
                 # a BoundedLinearExpression LHS, special case, like in objective
                 ortlhs = self._make_numexpr(lhs)
                 # ortools accepts sum(x) >= y over ORT variables
-                return self.ort_model.Add(eval_comparison(cpm_expr.name, ortlhs, ortrhs))
+                return self.ort_model.Add(_ORT_CMP[cpm_expr.name](ortlhs, ortrhs))
             elif cpm_expr.name == '==':
                 # NumExpr == IV, supported by ortools (thanks to `only_numexpr_equality()` transformation)
                 if lhs.name == 'min':
@@ -501,11 +700,21 @@ class CPM_ortools(SolverInterface):
                 elif lhs.name == 'element':
                     arr, idx = lhs.args
                     if is_int(idx): # OR-Tools does not handle all constant integer cases
-                        idx = intvar(idx,idx)
+                        ort_idx = self._get_constant(idx)
+                    else:
+                        ort_idx = self.solver_var(idx)
+                    # decomposed globals often emit many elements over the same array,
+                    # cache the mapped array; key by element ids (the stored entry
+                    # keeps the elements alive, so the ids remain stable)
+                    key = tuple(map(id, arr))
+                    cached = self._elemarr_cache.get(key)
+                    if cached is None:
+                        cached = self._elemarr_cache[key] = (list(arr), self.solver_vars(arr))
+                    ort_arr = cached[1]
                     # OR-Tools has slight different in argument order
                     return self.ort_model.AddElement(
-                        self.solver_var(idx),
-                        self.solver_vars(arr),
+                        ort_idx,
+                        ort_arr,
                         ortrhs
                     )
                 elif lhs.name == 'mod':
@@ -522,13 +731,22 @@ class CPM_ortools(SolverInterface):
                     if lhs.args[1] == 2:
                         b = self.solver_var(lhs.args[0])
                         return self.ort_model.AddMultiplicationEquality(ortrhs, [b,b])
-                    else: # need to create intermediate vars, post (((b * b) * b) * ...) * b == IV
+                    else: # exponentiation by squaring, needs O(log n) aux vars instead of n
                         b, n = lhs.args
-                        new_lhs = 1
-                        for exp in range(n):
-                            new_lhs, new_cons = get_or_make_var(b * new_lhs, csemap=self._csemap)
-                            self += new_cons
-                        return self.ort_model.Add(eval_comparison("==", self.solver_var(new_lhs), ortrhs))
+                        n = int(n)
+                        base, acc = b, None
+                        while n:
+                            if n & 1: # bit set, multiply accumulator with current power
+                                if acc is None:
+                                    acc = base
+                                else:
+                                    acc, new_cons = get_or_make_var(acc * base, csemap=self._csemap)
+                                    self += new_cons
+                            n >>= 1
+                            if n: # square the base for the next bit
+                                base, new_cons = get_or_make_var(base * base, csemap=self._csemap)
+                                self += new_cons
+                        return self.ort_model.Add(self.solver_var(acc) == ortrhs)
 
 
             raise NotImplementedError(
@@ -543,12 +761,18 @@ class CPM_ortools(SolverInterface):
                 assert (len(cpm_expr.args) == 2)  # args = [array, table]
                 array, table = cpm_expr.args
                 array = self.solver_vars(array)
-                # table needs to be a list of lists of integers
+                # table needs to be a list of lists of integers; convert numpy
+                # arrays in one C-level tolist() call, so the solver API does not
+                # type-check N*M numpy scalars one by one
+                if isinstance(table, np.ndarray):
+                    table = table.tolist()
                 return self.ort_model.AddAllowedAssignments(array, table)
             elif cpm_expr.name == 'negative_table':
                 assert (len(cpm_expr.args) == 2)  # args = [array, table]
                 array, table = cpm_expr.args
                 array = self.solver_vars(array)
+                if isinstance(table, np.ndarray):
+                    table = table.tolist()
                 return self.ort_model.AddForbiddenAssignments(array, table)
             elif cpm_expr.name == "regular":
                 array, transitions, start, accepting = cpm_expr.args
@@ -557,12 +781,23 @@ class CPM_ortools(SolverInterface):
                                                    [(cpm_expr.node_map[src], label, cpm_expr.node_map[dst]) for src, label, dst in transitions])
             elif cpm_expr.name == "cumulative":
                 start, dur, end, demand, cap = self.solver_vars(cpm_expr.args)
-                intervals = [self.ort_model.NewIntervalVar(s,d,e,f"interval_{s}-{d}-{e}") for s,d,e in zip(start,dur,end)]
-                return self.ort_model.AddCumulative(intervals, demand, cap)
+                # write the intervals and the cumulative constraint directly into
+                # the proto, the Python wrappers cost when posting thousands of tasks
+                add_interval = self._add_interval
+                intervals = [add_interval(s,d,e) for s,d,e in zip(start,dur,end)]
+                ct = self.ort_model.Proto().constraints.add()
+                ct.cumulative.intervals.extend(intervals)
+                for dem in demand:
+                    self._fill_linexpr(ct.cumulative.demands.add(), dem)
+                self._fill_linexpr(ct.cumulative.capacity, cap)
+                return None
             elif cpm_expr.name == "no_overlap":
                 start, dur, end = self.solver_vars(cpm_expr.args)
-                intervals = [self.ort_model.NewIntervalVar(s,d,e, f"interval_{s}-{d}-{d}") for s,d,e in zip(start,dur,end)]
-                return self.ort_model.add_no_overlap(intervals)
+                add_interval = self._add_interval
+                intervals = [add_interval(s,d,e) for s,d,e in zip(start,dur,end)]
+                ct = self.ort_model.Proto().constraints.add()
+                ct.no_overlap.intervals.extend(intervals)
+                return None
             elif cpm_expr.name == "circuit":
                 # ortools has a constraint over the arcs, so we need to create these
                 # when using an objective over arcs, using these vars direclty is recommended
@@ -571,10 +806,20 @@ class CPM_ortools(SolverInterface):
                 N = len(x)
                 arcvars = boolvar(shape=(N,N))
                 # post channeling constraints from int to bool
-                self += [b == (x[i] == j) for (i,j),b in np.ndenumerate(arcvars)]
+                # row i of arcvars maps x[i] onto 0..N-1; add_map_domain posts all N
+                # equivalences in one native call instead of N*N CPMpy constraints
+                # through the full transform() pipeline
+                for i in range(N):
+                    xi = x[i]
+                    ort_xi = self._get_constant(xi) if is_int(xi) else self.solver_var(xi)
+                    self.ort_model.add_map_domain(ort_xi, self.solver_vars(arcvars[i]), offset=0)
                 # post the global constraint
                 # when posting arcs on diagonal (i==j), it would do subcircuit
-                ort_arcs = [(i,j,self.solver_var(b)) for (i,j),b in np.ndenumerate(arcvars) if i != j]
+                # recover (i,j) arithmetically from the off-diagonal flat positions,
+                # np.ndenumerate would allocate N*N index tuples in Python
+                ks = np.flatnonzero(~np.eye(N, dtype=bool).ravel())
+                bvs = self.solver_vars(arcvars.ravel()[ks])
+                ort_arcs = list(zip((ks // N).tolist(), (ks % N).tolist(), bvs))
                 return self.ort_model.AddCircuit(ort_arcs)
             elif cpm_expr.name == 'inverse':
                 assert len(cpm_expr.args) == 2, "inverse() expects two args: fwd, rev"
@@ -592,7 +837,13 @@ class CPM_ortools(SolverInterface):
 
         # unlikely base case: True or False
         elif isinstance(cpm_expr, BoolVal):
-            return self.ort_model.Add(cpm_expr.args[0])
+            if cpm_expr.args[0] is True:
+                return None  # trivially satisfied, nothing to post
+            # False: post a single empty clause, the model is permanently UNSAT
+            if not self._false_posted:
+                self._false_posted = True
+                return self.ort_model.AddBoolOr([])
+            return None
 
         # a direct constraint, pass to solver
         elif isinstance(cpm_expr, DirectConstraint):
@@ -618,8 +869,19 @@ class CPM_ortools(SolverInterface):
         cpm_vars = flatlist(cpm_vars)
         vals = flatlist(vals)
         assert (len(cpm_vars) == len(vals)), "Variables and values must have the same size for hinting"
+        # write the hint into the proto directly, two repeated-field appends per
+        # variable instead of an AddHint call through the solver API
+        hint = self.ort_model.Proto().solution_hint
+        get = self._varmap.get  # dict lookup instead of solver_var dispatch per hint
         for (cpm_var, val) in zip(cpm_vars, vals):
-            self.ort_model.AddHint(self.solver_var(cpm_var), val)
+            ort_var = get(cpm_var)
+            if ort_var is None:
+                ort_var = self.solver_var(cpm_var)
+            idx = ort_var.Index()
+            if idx < 0:  # negated view, hint the underlying variable
+                idx, val = -idx-1, 1-int(val)
+            hint.vars.append(idx)
+            hint.values.append(int(val))
 
 
     def get_core(self):
@@ -634,7 +896,6 @@ class CPM_ortools(SolverInterface):
 
             Requires ortools >= 8.2!!!
         """
-        from ortools.sat.python import cp_model as ort
         assert (self.ort_status == ort.INFEASIBLE), "get_core(): solver must return UNSAT"
         assert (self.assumption_dict is not None),  "get_core(): requires a list of assumption variables, e.g. s.solve(assumptions=[...])"
 
@@ -642,53 +903,30 @@ class CPM_ortools(SolverInterface):
         assum_idx = self.ort_solver.SufficientAssumptionsForInfeasibility()
 
         # return cpm_variables corresponding to ort_assum vars in UNSAT core
-        return [self.assumption_dict[i] for i in assum_idx]
+        # (itemgetter does the indexing in one C-level call; MUS/OUS tools
+        #  call get_core() in tight loops)
+        if len(assum_idx) > 1:
+            return list(operator.itemgetter(*assum_idx)(self.assumption_dict))
+        elif len(assum_idx) == 1:
+            return [self.assumption_dict[assum_idx[0]]]
+        return []
 
     @classmethod
     def tunable_params(cls):
         """
             Suggestion of tunable hyperparameters of the solver.
             List compiled based on a conversation with OR-tools' Laurent Perron (issue #138).
+
+            Returns a fresh copy, safe for the caller to modify.
         """
-        return {
-            # 'use_branching_in_lp': [False, True], # removed in OR-tools >= v9.9
-            'optimize_with_core' : [False, True],
-            'search_branching': [0,1,2,3,4,5,6],
-            'boolean_encoding_level' : [0,1,2,3],
-            'linearization_level': [0, 1, 2],
-            'core_minimization_level' : [0,1,2], # new in OR-tools>= v9.8
-            'cp_model_probing_level': [0, 1, 2, 3],
-            'cp_model_presolve' : [False, True],
-            'clause_cleanup_ordering' : [0,1],
-            'binary_minimization_algorithm' : [0,1,2,3,4],
-            'minimization_algorithm' : [0,1,2,3],
-            'use_phase_saving' : [False, True]
-        }
+        return dict(_TUNABLE_PARAMS)
 
     @classmethod
     def default_params(cls):
-        return {
-            # 'use_branching_in_lp': False, # removed in OR-tools >= v9.9
-            'optimize_with_core': False,
-            'search_branching': 0,
-            'boolean_encoding_level': 1,
-            'linearization_level': 1,
-            'core_minimization_level': 2,# new in OR-tools>=v9.8
-            'cp_model_probing_level': 2,
-            'cp_model_presolve': True,
-            'clause_cleanup_ordering': 0,
-            'binary_minimization_algorithm': 1,
-            'minimization_algorithm': 2,
-            'use_phase_saving': True
-        }
+        return dict(_DEFAULT_PARAMS)
 
 
-# solvers are optional, so this file should be interpretable
-# even if ortools is not installed...
-try:
-    from ortools.sat.python import cp_model as ort
-    import time
-
+if ort is not None:
 
     class OrtSolutionCounter(ort.CpSolverSolutionCallback):
         """
@@ -712,23 +950,23 @@ try:
 
         def __init__(self, verbose=False):
             super().__init__()
-            self.__solution_count = 0
-            self.__verbose = verbose
-            if self.__verbose:
-                self.__start_time = time.time()
+            self._solution_count = 0
+            self._verbose = verbose
+            if self._verbose:
+                self._start_time = time.time()
 
         def on_solution_callback(self):
             """Called on each new solution."""
-            if self.__verbose:
+            if self._verbose:
                 current_time = time.time()
                 obj = self.ObjectiveValue()
                 print('Solution %i, time = %0.2f s, objective = %i' %
-                      (self.__solution_count, current_time - self.__start_time, obj))
-            self.__solution_count += 1
+                      (self._solution_count, current_time - self._start_time, obj))
+            self._solution_count += 1
 
         def solution_count(self):
             """Returns the number of solutions found."""
-            return self.__solution_count
+            return self._solution_count
 
     class OrtSolutionPrinter(OrtSolutionCounter):
         """
@@ -775,33 +1013,80 @@ try:
             elif callable(display):
                 # might use any, so populate all (user) variables with their values
                 self._cpm_vars = solver.user_vars
+            # value-mapping plan, built lazily on the first solution
+            self._plan = None
+            # choose the display dispatch once instead of per solution
+            if isinstance(display, Expression):
+                self._print_fn = lambda: print(argval(display))
+            elif isinstance(display, list):
+                # explicit list of expressions to display
+                self._print_fn = lambda: print(argvals(display))
+            else:  # callable or None
+                self._print_fn = display
+            if display is None and solution_limit is None and not verbose:
+                # pure counting run, swap in the minimal callback
+                self.on_solution_callback = self._count_only_cb
+
+        def _count_only_cb(self):
+            """Minimal callback for counting-only enumeration (no display/limit)."""
+            self._solution_count += 1
+
+        def _build_plan(self):
+            """
+                Group `self._cpm_vars` into runs of consecutive proto indices,
+                as (vars, start, stop, is_bool) tuples; each run can then be read
+                from the response's solution vector with a single slice
+            """
+            # flatten to (cpm_var, proto_index, is_bool) triples
+            triples = []
+            varmap = self._varmap
+            for cpm_var in self._cpm_vars:
+                # it might be an NDVarArray
+                if hasattr(cpm_var, "flat"):
+                    triples.extend((sub, varmap[sub].Index(), isinstance(sub, _BoolVarImpl))
+                                   for sub in cpm_var.flat)
+                else:
+                    triples.append((cpm_var, varmap[cpm_var].Index(), isinstance(cpm_var, _BoolVarImpl)))
+            # variables created together get consecutive indices, merge those runs
+            plan = []
+            i, n = 0, len(triples)
+            while i < n:
+                _, start, is_bool = triples[i]
+                stop = start + 1
+                j = i + 1
+                while j < n and triples[j][1] == stop and triples[j][2] == is_bool:
+                    stop += 1
+                    j += 1
+                plan.append(([t[0] for t in triples[i:j]], start, stop, is_bool))
+                i = j
+            return plan
 
         def on_solution_callback(self):
             """Called on each new solution."""
-            super().on_solution_callback()
+            if self._verbose:
+                super().on_solution_callback()
+            else:
+                # inline the count, saves a call frame per solution
+                self._solution_count += 1
             if len(self._cpm_vars):
                 # populate values before printing
-                for cpm_var in self._cpm_vars:
-                    # it might be an NDVarArray
-                    if hasattr(cpm_var, "flat"):
-                        for cpm_subvar in cpm_var.flat:
-                            cpm_subvar._value = self.Value(self._varmap[cpm_subvar])
-                    elif isinstance(cpm_var, _BoolVarImpl):
-                        cpm_var._value = bool(self.Value(self._varmap[cpm_var]))
+                plan = self._plan
+                if plan is None:
+                    plan = self._plan = self._build_plan()
+                # one response fetch, then one slice per run of consecutive
+                # indices, instead of a Value() crossing per variable
+                sol = self.Response().solution
+                for run_vars, start, stop, is_bool in plan:
+                    vals = sol[start:stop]
+                    if is_bool:
+                        for cpm_var, value in zip(run_vars, vals):
+                            cpm_var._value = bool(value)
                     else:
-                        cpm_var._value = self.Value(self._varmap[cpm_var])
+                        for cpm_var, value in zip(run_vars, vals):
+                            cpm_var._value = value
 
-                if isinstance(self._display, Expression):
-                    print(argval(self._display))
-                elif isinstance(self._display, list):
-                    # explicit list of expressions to display
-                    print(argvals(self._display))
-                else: # callable
-                    self._display()
+                self._print_fn()
 
             # check for count limit
             if self.solution_count() == self._solution_limit:
                 self.StopSearch()
-
-except ImportError:
-    pass  # Ok, no ortools installed...
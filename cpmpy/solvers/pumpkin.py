@@ -7,11 +7,14 @@ from .solver_interface import SolverInterface, SolverStatus, ExitStatus
 from ..expressions.core import Expression, Comparison, Operator, BoolVal
 from ..expressions.python_builtins import any as cpm_any
 from ..expressions.globalconstraints import GlobalConstraint
+import numpy as np
+
 from ..expressions.variables import (
     _BoolVarImpl,
     NegBoolView,
     _IntVarImpl,
     _NumVarImpl,
+    NDVarArray,
     intvar,
     boolvar,
 )
@@ -25,7 +28,7 @@ from ..expressions.utils import (
 )
 from ..transformations.get_variables import get_variables
 from ..transformations.linearize import canonical_comparison
-from ..transformations.normalize import toplevel_list
+from ..transformations.normalize import toplevel_list, toplevel_iter
 from ..transformations.negation import push_down_negation
 from ..transformations.decompose_global import decompose_in_tree
 from ..transformations.flatten_model import flatten_constraint, flatten_objective
@@ -35,6 +38,48 @@ from ..transformations.safening import no_partial_functions
 
 import time
 
+try:
+    import pumpkin_solver_py
+    from pumpkin_solver_py import (
+        Model,
+        Comparator,
+        Predicate,
+        constraints,
+        BoolExpression as PumpkinBool,
+        IntExpression as PumpkinInt,
+        SatisfactionResult,
+        SatisfactionUnderAssumptionsResult,
+    )
+    from pumpkin_solver_py.optimisation import OptimisationResult, Direction
+
+    # comparison name -> (Comparator, rhs offset), for to_predicate()
+    _COMP_TABLE = {
+        "==": (Comparator.Equal, 0),
+        "<=": (Comparator.LessThanOrEqual, 0),
+        ">=": (Comparator.GreaterThanOrEqual, 0),
+        "!=": (Comparator.NotEqual, 0),
+        "<": (Comparator.LessThanOrEqual, -1),
+        ">": (Comparator.GreaterThanOrEqual, 1),
+    }
+
+    # comparison name -> (constraint, negate lhs?, rhs rewrite), for _get_constraint()
+    _CMP_POST = {
+        "<=": (constraints.LessThanOrEquals, False, lambda r: r),
+        "<":  (constraints.LessThanOrEquals, False, lambda r: r - 1),
+        ">=": (constraints.LessThanOrEquals, True,  lambda r: -r),
+        ">":  (constraints.LessThanOrEquals, True,  lambda r: -r - 1),
+        "!=": (constraints.NotEquals,        False, lambda r: r),
+    }
+except ImportError:
+    pumpkin_solver_py = None
+
+# constant sets used by transform(), built once instead of per call
+_SUPPORTED = frozenset({"alldifferent", "cumulative", "min", "max", "element",
+                        "table", "negative_table"})
+_SUPPORTED_HALFREIF = frozenset({"or", "sum", "wsum", "sub", "mul", "div", "abs",
+                                 "min", "max", "cumulative"})
+_NUMEXPR_EQ = frozenset({"sum", "wsum", "sub"})
+
 """
     Interface to Pumpkin's API
 
@@ -68,13 +113,8 @@ class CPM_pumpkin(SolverInterface):
 
     @staticmethod
     def supported():
-        # try to import the package
-        try:
-            import pumpkin_solver_py as gp
-
-            return True
-        except ImportError:
-            return False
+        # package imported at module load time (if present)
+        return pumpkin_solver_py is not None
 
     def __init__(self, cpm_model=None, subsolver=None):
         """
@@ -89,8 +129,6 @@ class CPM_pumpkin(SolverInterface):
                 "CPM_Pumpkin: Install the python package 'pumpkin_solver_py'"
             )
 
-        from pumpkin_solver_py import Model
-
         assert subsolver is None  # unless you support subsolvers, see pysat or minizinc
 
         # initialise the native solver object
@@ -100,12 +138,33 @@ class CPM_pumpkin(SolverInterface):
         # a dictionary for constant variables, so they can be re-used
         self._constantvars = dict()
 
+        # cached integer views of Boolean variables (see _as_int)
+        self._int_view = dict()
+
+        # id-keyed shortcut over _varmap (entries hold the variable too,
+        # so ids stay valid); includes negated views, unlike _varmap
+        self._fast_varmap = dict()
+
+        # variables whose _value was filled in by the last successful solve
+        self._last_solved_vars = []
+
+        # assumption -> predicate translations, keyed by id; the entry keeps a
+        # reference to the expression so the id cannot be reused
+        self._pred_cache = dict()
+
+        # (sub)expressions already walked for user variables, keyed by id;
+        # the dict keeps the expressions alive so ids stay valid
+        self._visited_exprs = dict()
+
         # for objective
         self._objective = None
+        self._obj_solver_var = None
         self.objective_is_min = True
 
         # dictionary of tags to user constraints
         self.user_cons = dict()
+        # same constraints as a set, for O(1) duplicate detection in __add__
+        self._user_cons_set = set()
 
         # initialise everything else and post the constraints/objective
         # [GUIDELINE] this superclass call should happen AFTER all solver-native objects are created.
@@ -131,17 +190,6 @@ class CPM_pumpkin(SolverInterface):
         # [GUIDELINE] Add link to documentation of all solver parameters
         """
 
-        # Again, I don't know why this is necessary, but the PyO3 modules seem to be a bit wonky.
-        from pumpkin_solver_py import (
-            BoolExpression as PumpkinBool,
-            IntExpression as PumpkinInt,
-        )
-        from pumpkin_solver_py import (
-            SatisfactionResult,
-            SatisfactionUnderAssumptionsResult,
-        )
-        from pumpkin_solver_py.optimisation import OptimisationResult, Direction
-
         # ensure all vars are known to solver
         self.solver_vars(list(self.user_vars))
 
@@ -162,7 +210,7 @@ class CPM_pumpkin(SolverInterface):
             solve_func = self.pum_solver.optimise
             kwargs.update(
                 proof=proof,
-                objective=self.solver_var(self._objective),
+                objective=self._obj_solver_var,
                 direction=Direction.Minimise
                 if self.objective_is_min
                 else Direction.Maximise,
@@ -170,14 +218,23 @@ class CPM_pumpkin(SolverInterface):
 
         elif assumptions is not None:
             assert proof is None, "Proof-logging under assumptions is not supported"
-            pum_assumptions = [self.to_predicate(a) for a in assumptions]
+            # incremental workflows (MUS, core-guided search) re-solve with
+            # largely the same assumptions; reuse their predicate translations
+            pred_cache = self._pred_cache
+            pum_assumptions = []
+            for a in assumptions:
+                entry = pred_cache.get(id(a))
+                if entry is None:
+                    entry = pred_cache[id(a)] = (a, self.to_predicate(a))
+                pum_assumptions.append(entry[1])
             self.assump_map = dict(zip(pum_assumptions, assumptions))
             solve_func = self.pum_solver.satisfy_under_assumptions
             kwargs.update(assumptions=pum_assumptions)
 
         else:
             solve_func = self.pum_solver.satisfy
-            kwargs.update(proof=proof)
+            if proof is not None:
+                kwargs["proof"] = proof
 
         self._pum_core = None
         kwargs.update(timeout=time_limit)
@@ -234,27 +291,35 @@ class CPM_pumpkin(SolverInterface):
             solution = result._0
             self.cpm_status.exitstatus = ExitStatus.OPTIMAL
 
-            # fill in variable values
+            # fill in variable values; the bindings expose no bulk readback,
+            # so one value call per variable remains, but hoist the method
+            # and varmap lookups out of the loop
+            int_value = solution.int_value
+            bool_value = solution.bool_value
+            varmap_get = self._varmap.get
             for cpm_var in self.user_vars:
-                sol_var = self.solver_var(cpm_var)
-                if isinstance(sol_var, PumpkinInt):
-                    cpm_var._value = solution.int_value(sol_var)
-                elif isinstance(sol_var, PumpkinBool):
-                    cpm_var._value = solution.bool_value(sol_var)
+                sol_var = varmap_get(cpm_var)
+                if sol_var is None:
+                    sol_var = self.solver_var(cpm_var)
+                if isinstance(cpm_var, _BoolVarImpl):
+                    cpm_var._value = bool_value(sol_var)
+                elif isinstance(cpm_var, _NumVarImpl):
+                    cpm_var._value = int_value(sol_var)
                 else:
                     raise NotSupportedError(
                         "Only boolean and integer variables are supported."
                     )
 
             # translate solution values
+            self._last_solved_vars = list(self.user_vars)
+
             if self.has_objective():
-                self.objective_value_ = solution.int_value(
-                    self.solver_var(self._objective)
-                )
+                self.objective_value_ = solution.int_value(self._obj_solver_var)
 
-        else:  # wipe results
-            for cpm_var in self.user_vars:
+        else:  # wipe the results of the previous solve (new vars are None already)
+            for cpm_var in self._last_solved_vars:
                 cpm_var._value = None
+            self._last_solved_vars = []
 
         return has_sol
 
@@ -264,19 +329,20 @@ class CPM_pumpkin(SolverInterface):
         or returns from cache if previously created
         """
 
+        # id-keyed fast path, skips the isinstance cascade on repeat lookups
+        entry = self._fast_varmap.get(id(cpm_var))
+        if entry is not None:
+            return entry[1]
+
         if is_num(cpm_var):
             return cpm_var
-            if not cpm_var in self._constantvars:
-                self._constantvars[cpm_var] = self.pum_solver.new_integer_variable(
-                    cpm_var, cpm_var, name=str(cpm_var)
-                )
-
-            return self._constantvars[cpm_var]
 
         # special case, negative-bool-view
         # work directly on var inside the view
         if isinstance(cpm_var, NegBoolView):
-            return self.solver_var(cpm_var._bv).negate()
+            revar = self.solver_var(cpm_var._bv).negate()
+            self._fast_varmap[id(cpm_var)] = (cpm_var, revar)
+            return revar
 
         # create if it does not exist
         if cpm_var not in self._varmap:
@@ -291,7 +357,9 @@ class CPM_pumpkin(SolverInterface):
             self._varmap[cpm_var] = revar
 
         # return from cache
-        return self._varmap[cpm_var]
+        revar = self._varmap[cpm_var]
+        self._fast_varmap[id(cpm_var)] = (cpm_var, revar)
+        return revar
 
     def objective(self, expr, minimize=True):
         """
@@ -309,6 +377,7 @@ class CPM_pumpkin(SolverInterface):
 
         # make objective function or variable and post
         self._objective = obj_var
+        self._obj_solver_var = self.solver_var(obj_var)  # resolved once, solve() reuses it
         self.objective_is_min = minimize
 
     def has_objective(self):
@@ -331,48 +400,24 @@ class CPM_pumpkin(SolverInterface):
         """
         # apply transformations
         cpm_cons = toplevel_list(cpm_expr)
-        supported = {
-            "alldifferent",
-            "cumulative",
-            "min",
-            "max",
-            "element",
-            "table",
-            "negative_table",
-        }
-
-        cpm_cons = decompose_in_tree(cpm_cons, supported=supported)
+        cpm_cons = decompose_in_tree(cpm_cons, supported=_SUPPORTED)
         # safening after decompose here, need to safen toplevel elements too
         #   which come from decomposition of other global constraints...
         cpm_cons = no_partial_functions(cpm_cons, safen_toplevel={"element"})
         cpm_cons = flatten_constraint(cpm_cons)  # flat normal form
         cpm_cons = only_bv_reifies(cpm_cons)
         cpm_cons = only_implies(cpm_cons)
-        supported_halfreif = {
-            "or",
-            "sum",
-            "wsum",
-            "sub",
-            "mul",
-            "div",
-            "abs",
-            "min",
-            "max",
-            "cumulative",
-        }
         cpm_cons = reify_rewrite(
-            cpm_cons, supported=supported_halfreif
+            cpm_cons, supported=_SUPPORTED_HALFREIF
         )  # reified element not supported yet (TODO?)
         cpm_cons = only_numexpr_equality(
-            cpm_cons, supported=frozenset(["sum", "wsum", "sub"])
+            cpm_cons, supported=_NUMEXPR_EQ
         )  # supports >, <, !=
         cpm_cons = canonical_comparison(cpm_cons)  # ensure rhs is always a constant
         return cpm_cons
 
     def to_predicate(self, cpm_expr):
         """ """
-        from pumpkin_solver_py import Comparator, Predicate
-
         if isinstance(cpm_expr, _BoolVarImpl):
             if isinstance(cpm_expr, NegBoolView):
                 lhs, comp, rhs = cpm_expr._bv, Comparator.LessThanOrEqual, 0
@@ -393,18 +438,8 @@ class CPM_pumpkin(SolverInterface):
 
             assert isinstance(lhs, _NumVarImpl), "lhs should be variable"
 
-            if cpm_expr.name == "==":
-                comp = Comparator.Equal
-            if cpm_expr.name == "<=":
-                comp = Comparator.LessThanOrEqual
-            if cpm_expr.name == ">=":
-                comp = Comparator.GreaterThanOrEqual
-            if cpm_expr.name == "!=":
-                comp = Comparator.NotEqual
-            if cpm_expr.name == "<":
-                comp, rhs = Comparator.LessThanOrEqual, rhs - 1
-            if cpm_expr.name == ">":
-                comp, rhs = Comparator.GreaterThanOrEqual, rhs + 1
+            comp, offset = _COMP_TABLE[cpm_expr.name]
+            rhs = rhs + offset
 
         else:
             raise ValueError(
@@ -414,13 +449,71 @@ class CPM_pumpkin(SolverInterface):
         var = self._ivars(lhs)
         return Predicate(var, comp, rhs)
 
+    def _collect_new_vars(self, expr):
+        """
+        Add the variables of `expr` to `user_vars`, like `get_variables` with
+        collect=, but skip subtrees an earlier `__add__` already walked; users
+        posting constraints one at a time otherwise rewalk shared subtrees
+        every call
+        """
+        visited = self._visited_exprs
+        append = self.user_vars.add
+
+        def extract(lst):
+            for e in lst:
+                if isinstance(e, Expression):
+                    eid = id(e)
+                    if eid in visited:
+                        continue
+                    visited[eid] = e
+                    if isinstance(e, _NumVarImpl):
+                        if isinstance(e, NegBoolView):
+                            # this is just a view, collect the actual variable
+                            e = e._bv
+                        append(e)
+                    elif isinstance(e, NDVarArray):  # sometimes does not have a .name
+                        if e.dtype == object:
+                            extract(e.flat)
+                        # else: all const, skip
+                    elif e.name == "wsum":
+                        extract(e.args[1])  # skip data in arg0
+                    elif e.name == "table":
+                        extract(e.args[0])  # skip data in arg1
+                    else:
+                        extract(e.args)
+                elif isinstance(e, (list, tuple, np.flatiter, np.ndarray, set)):
+                    extract(e)
+
+        extract((expr,))
+
+    def _as_int(self, cpm_var):
+        """
+        Integer view of a variable; caches the `boolean_as_integer` projection
+        so each Boolean variable is converted once, not once per use
+        """
+        if isinstance(cpm_var, _BoolVarImpl):
+            int_view = self._int_view.get(cpm_var)
+            if int_view is None:
+                int_view = self._int_view[cpm_var] = self.pum_solver.boolean_as_integer(
+                    self.solver_var(cpm_var)
+                )
+            return int_view
+        return self.solver_var(cpm_var)
+
     def _ivars(self, cpm_var):
         if is_any_list(cpm_var):
             return [self._ivars(v) for v in cpm_var]
         elif isinstance(cpm_var, _BoolVarImpl):
-            return self.pum_solver.boolean_as_integer(self.solver_var(cpm_var))
+            return self._as_int(cpm_var)
         elif is_num(cpm_var):
-            return self.solver_var(intvar(cpm_var, cpm_var))
+            # cache per value, one solver variable per distinct constant
+            value = int(cpm_var)
+            pum_const = self._constantvars.get(value)
+            if pum_const is None:
+                pum_const = self._constantvars[value] = self.pum_solver.new_integer_variable(
+                    value, value, name=str(value)
+                )
+            return pum_const
         else:
             return self.solver_var(cpm_var)
 
@@ -431,49 +524,55 @@ class CPM_pumpkin(SolverInterface):
 
         :return: Returns a list of Pumpkin integer expressions
         """
-        args = []
-        if isinstance(expr, Operator) and expr.name == "sum":
-            for cpm_var in expr.args:
-                pum_var = self.solver_var(cpm_var)
-                if cpm_var.is_bool():  # have convert to integer
-                    pum_var = self.pum_solver.boolean_as_integer(pum_var)
-                args.append(pum_var.scaled(-1 if negate else 1))
-        elif isinstance(expr, Operator) and expr.name == "wsum":
-            for w, cpm_var in zip(*expr.args):
-                if w == 0:
-                    continue  # exclude
-                pum_var = self.solver_var(cpm_var)
-                if cpm_var.is_bool():  # have convert to integer
-                    pum_var = self.pum_solver.boolean_as_integer(pum_var)
-                args.append(pum_var.scaled(-w if negate else w))
-        elif isinstance(Operator, expr) and expr.name == "sub":
-            x, y = self.solver_vars(expr.args)
-            if expr.args[0].is_bool():
-                x = self.pum_solver.boolean_as_integer(x)
-            if expr.args[1].is_bool():
-                y = self.pum_solver.boolean_as_integer(y)
-            args = [x.scaled(-1 if negate else 1), y.scaled(1 if negate else -1)]
+        # hot path when posting linear constraints, bind methods once
+        as_int = self._as_int
+        sign = -1 if negate else 1
+
+        if not isinstance(expr, Operator):
+            raise ValueError(f"Unknown expression to convert in sum-arguments: {expr}")
+        if expr.name == "sum":
+            weights, variables = None, expr.args  # all terms have weight `sign`
+        elif expr.name == "wsum":
+            weights, variables = expr.args
+            if negate:
+                weights = [-w for w in weights]
+        elif expr.name == "sub":
+            weights, variables = [sign, -sign], expr.args
         else:
             raise ValueError(f"Unknown expression to convert in sum-arguments: {expr}")
+        if weights is None:
+            weights = [sign] * len(variables)
+
+        args = []
+        append = args.append
+        for w, cpm_var in zip(weights, variables):
+            if w == 0:
+                continue  # exclude
+            pum_var = as_int(cpm_var)  # converts Booleans to integer (cached)
+            append(pum_var if w == 1 else pum_var.scaled(w))
         return args
 
     def _get_constraint(self, cpm_expr):
-        from pumpkin_solver_py import constraints
+        # called per transformed constraint, bind the helpers once
+        solver_var = self.solver_var
+        solver_vars = self.solver_vars
+        ivars = self._ivars
+        sum_args = self._sum_args
 
         if isinstance(cpm_expr, _BoolVarImpl):
             # base case, just var or ~var
             forced_sum = Operator("sum", [cpm_expr])
-            return [constraints.Equals(self._sum_args(forced_sum), 1)]
+            return [constraints.Equals(sum_args(forced_sum), 1)]
 
         elif isinstance(cpm_expr, Operator):
             if cpm_expr.name == "or":
                 hacked = Operator("sum", cpm_expr.args)
                 return [
                     constraints.LessThanOrEquals(
-                        self._sum_args(hacked, negate=True), -1
+                        sum_args(hacked, negate=True), -1
                     )
                 ]
-                return [constraints.Clause(self.solver_vars(cpm_expr.args))]
+                return [constraints.Clause(solver_vars(cpm_expr.args))]
 
             raise NotImplementedError("Pumpkin: operator not (yet) supported", cpm_expr)
 
@@ -489,56 +588,42 @@ class CPM_pumpkin(SolverInterface):
 
             if cpm_expr.name == "==":
                 if "sum" in lhs.name or lhs.name == "sub":
-                    return [constraints.Equals(self._sum_args(lhs), rhs)]
+                    return [constraints.Equals(sum_args(lhs), rhs)]
 
-                pum_rhs = self._ivars(rhs)  # other operators require IntExpression
+                pum_rhs = ivars(rhs)  # other operators require IntExpression
                 if lhs.name == "div":
-                    return [constraints.Division(*self._ivars(lhs.args), pum_rhs)]
+                    return [constraints.Division(*ivars(lhs.args), pum_rhs)]
                 elif lhs.name == "mul":
-                    return [constraints.Times(*self._ivars(lhs.args), pum_rhs)]
+                    return [constraints.Times(*ivars(lhs.args), pum_rhs)]
                 elif lhs.name == "abs":
-                    return [constraints.Absolute(self.solver_var(lhs), pum_rhs)]
+                    return [constraints.Absolute(solver_var(lhs), pum_rhs)]
                 elif lhs.name == "min":
-                    return [constraints.Minimum(self._ivars(lhs.args), pum_rhs)]
+                    return [constraints.Minimum(ivars(lhs.args), pum_rhs)]
                 elif lhs.name == "max":
-                    return [constraints.Maximum(self._ivars(lhs.args), pum_rhs)]
+                    return [constraints.Maximum(ivars(lhs.args), pum_rhs)]
                 elif lhs.name == "element":
                     arr, idx = lhs.args
                     return [
-                        constraints.Element(self._ivars(idx), self._ivars(arr), pum_rhs)
+                        constraints.Element(ivars(idx), ivars(arr), pum_rhs)
                     ]
 
                 raise NotImplementedError("Unknown lhs of comparison", cpm_expr)
 
-            elif cpm_expr.name == "<=":
-                return [constraints.LessThanOrEquals(self._sum_args(lhs), rhs)]
-
-            elif cpm_expr.name == "<":
-                return [constraints.LessThanOrEquals(self._sum_args(lhs), rhs - 1)]
-
-            elif cpm_expr.name == ">=":
-                return [
-                    constraints.LessThanOrEquals(self._sum_args(lhs, negate=True), -rhs)
-                ]
-
-            elif cpm_expr.name == ">":
-                return [
-                    constraints.LessThanOrEquals(
-                        self._sum_args(lhs, negate=True), -rhs - 1
-                    )
-                ]
-            elif cpm_expr.name == "!=":
-                return [constraints.NotEquals(self._sum_args(lhs), rhs)]
+            # remaining comparators all post over _sum_args, dispatch via table
+            handler = _CMP_POST.get(cpm_expr.name)
+            if handler is not None:
+                post, negate, rhs_rewrite = handler
+                return [post(sum_args(lhs, negate=negate), rhs_rewrite(rhs))]
 
             raise ValueError("Unknown comparison", cpm_expr)
 
         elif isinstance(cpm_expr, GlobalConstraint):
             if cpm_expr.name == "alldifferent":
-                return [constraints.AllDifferent(self.solver_vars(cpm_expr.args))]
+                return [constraints.AllDifferent(solver_vars(cpm_expr.args))]
             elif cpm_expr.name in ["table", "negative_table"]:
                 variables, table = cpm_expr.args
 
-                solver_variables = self.solver_vars(variables)
+                solver_variables = solver_vars(variables)
 
                 if cpm_expr.name == "table":
                     return [constraints.Table(solver_variables, table)]
@@ -561,14 +646,16 @@ class CPM_pumpkin(SolverInterface):
                     "Pumpkin only accepts Cumulative with fixed capacity"
                 )
 
-                return [
-                    constraints.Cumulative(self.solver_vars(start), dur, demand, cap)
-                ] + [
-                    self._get_constraint(c)[0]
-                    for c in self.transform(
-                        [s + d == e for s, d, e in zip(start, dur, end)]
-                    )
-                ]
+                cons = [constraints.Cumulative(solver_vars(start), dur, demand, cap)]
+                # link s + d == e per task; durations are fixed (see asserts), so
+                # post the linear equality directly instead of re-entering transform()
+                for s, d, e in zip(start, dur, end):
+                    if isinstance(s, _NumVarImpl) and isinstance(e, _NumVarImpl):
+                        cons.append(constraints.Equals([ivars(s), ivars(e).scaled(-1)], -int(d)))
+                    else:  # constant start or end, fall back to the pipeline
+                        cons.extend(c for flat in self.transform([s + d == e])
+                                      for c in self._get_constraint(flat))
+                return cons
             else:
                 raise NotImplementedError(f"Unknown global constraint {cpm_expr}")
 
@@ -600,41 +687,43 @@ class CPM_pumpkin(SolverInterface):
 
         :return: self
         """
-        from pumpkin_solver_py import constraints
-
-        # add new user vars to the set
-        get_variables(cpm_expr_orig, collect=self.user_vars)
-
-        # transform and post the constraints
-        for orig_expr in toplevel_list(cpm_expr_orig, merge_and=True):
-            if orig_expr in set(self.user_cons.values()):
+        # add new user vars to the set, skipping already-walked subtrees
+        self._collect_new_vars(cpm_expr_orig)
+
+        # the bindings have no bulk-post API, each constraint crosses the FFI
+        # individually; at least bind the entry points outside the loops
+        add_constraint = self.pum_solver.add_constraint
+        add_implication = self.pum_solver.add_implication
+        get_constraint = self._get_constraint
+        Clause = constraints.Clause
+
+        # transform and post the constraints, streaming the top-level expressions
+        for orig_expr in toplevel_iter(cpm_expr_orig, merge_and=True):
+            if orig_expr in self._user_cons_set:
                 continue
             else:
                 constraint_tag = len(self.user_cons) + 1
                 self.user_cons[constraint_tag] = orig_expr
+                self._user_cons_set.add(orig_expr)
             for cpm_expr in self.transform(orig_expr):
                 if (
                     isinstance(cpm_expr, Operator) and cpm_expr.name == "->"
                 ):  # found implication
                     bv, subexpr = cpm_expr.args
-                    for cons in self._get_constraint(subexpr):
-                        if isinstance(cons, constraints.Clause):
+                    pum_bv = self.solver_var(bv)
+                    for cons in get_constraint(subexpr):
+                        if isinstance(cons, Clause):
                             raise ValueError(
                                 "_get_constraint should not return clauses"
                             )
-                        self.pum_solver.add_implication(
-                            cons,
-                            self.solver_var(bv),
-                        )
+                        add_implication(cons, pum_bv)
                 else:
-                    solver_constraints = self._get_constraint(cpm_expr)
-
-                    for cons in solver_constraints:
-                        if isinstance(cons, constraints.Clause):
+                    for cons in get_constraint(cpm_expr):
+                        if isinstance(cons, Clause):
                             raise ValueError(
                                 "_get_constraint should not return clauses"
                             )
-                        self.pum_solver.add_constraint(cons)
+                        add_constraint(cons)
 
         return self
 
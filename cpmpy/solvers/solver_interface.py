@@ -173,10 +173,23 @@ class SolverInterface(object):
     def solver_vars(self, cpm_vars):
         """
            Like `solver_var()` but for arbitrary shaped lists/tensors
+
+           Hot path during model posting: looks up the variable cache directly
+           and only dispatches to `solver_var()` on a cache miss.
         """
-        if is_any_list(cpm_vars):
-            return [self.solver_vars(v) for v in cpm_vars]
-        return self.solver_var(cpm_vars)
+        if not is_any_list(cpm_vars):
+            return self.solver_var(cpm_vars)
+
+        get = self._varmap.get  # avoid repeated attribute resolution in the loop
+        svars = []
+        append = svars.append
+        for v in cpm_vars:
+            if is_any_list(v):
+                append(self.solver_vars(v))
+            else:
+                sv = get(v)
+                append(sv if sv is not None else self.solver_var(v))
+        return svars
 
     def transform(self, cpm_expr):
         """
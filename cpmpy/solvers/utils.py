@@ -16,23 +16,54 @@
         param_combinations
 """
 
+import importlib
+import itertools
 import warnings # for deprecation warning
 
-from .gurobi import CPM_gurobi
-from .ortools import CPM_ortools
-from .minizinc import CPM_minizinc
-from .pysat import CPM_pysat
-from .z3 import CPM_z3
-from .gcs import CPM_gcs
-from .pysdd import CPM_pysdd
-from .exact import CPM_exact
-from .choco import CPM_choco
-from .pumpkin import CPM_pumpkin
-from .cpo   import CPM_cpo
+# solver interface modules are imported lazily (PEP 562): even though each
+# interface guards its backend import, pulling in all of them up front is the
+# bulk of the `import cpmpy` cost
+_SOLVER_MODULES = {
+    "CPM_ortools": ".ortools",
+    "CPM_z3": ".z3",
+    "CPM_minizinc": ".minizinc",
+    "CPM_gcs": ".gcs",
+    "CPM_gurobi": ".gurobi",
+    "CPM_pysat": ".pysat",
+    "CPM_pysdd": ".pysdd",
+    "CPM_exact": ".exact",
+    "CPM_choco": ".choco",
+    "CPM_pumpkin": ".pumpkin",
+    "CPM_cpo": ".cpo",
+}
+
+
+def __getattr__(name):
+    modname = _SOLVER_MODULES.get(name)
+    if modname is not None:
+        value = getattr(importlib.import_module(modname, __package__), name)
+        globals()[name] = value  # cache, next access skips this hook
+        return value
+    if name == "builtin_solvers":
+        # using `builtin_solvers` is DEPRECATED, use `SolverLookup` object instead
+        # Order matters! first is default, then tries second, etc...
+        value = [_solver_class(n) for n in ("CPM_ortools", "CPM_gurobi", "CPM_minizinc",
+                                            "CPM_pysat", "CPM_exact", "CPM_choco")]
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _solver_class(attrname):
+    """ Resolve a (lazily imported) solver class by its attribute name """
+    value = globals().get(attrname)
+    if value is None:
+        value = __getattr__(attrname)
+    return value
 
 def param_combinations(all_params, remaining_keys=None, cur_params=None):
     """
-        Recursively yield all combinations of param values
+        Yield all combinations of param values
 
         For example usage, see `examples/advanced/hyperparameter_search.py`
         https://github.com/CPMpy/cpmpy/blob/master/examples/advanced/hyperparameter_search.py
@@ -44,24 +75,20 @@ def param_combinations(all_params, remaining_keys=None, cur_params=None):
           of the keys and values. For the example above:
           ``generator([{'val':1,'opt':True},{'val':1,'opt':False},{'val':2,'opt':True},{'val':2,'opt':False}])``
     """
-    if remaining_keys is None or cur_params is None:
-        # init
-        remaining_keys = list(all_params.keys())
-        cur_params = dict()
-
-    cur_key = remaining_keys[0]
-    for cur_value in all_params[cur_key]:
-        cur_params[cur_key] = cur_value
-        if len(remaining_keys) == 1:
-            # terminal, return copy
-            yield dict(cur_params)
-        else:
-            # recursive call
-            yield from param_combinations(all_params, 
-                            remaining_keys=remaining_keys[1:],
-                            cur_params=cur_params)
+    if remaining_keys is not None or cur_params is not None:
+        warnings.warn("The 'remaining_keys' and 'cur_params' arguments were internal "
+                      "to the old recursive implementation and are ignored, do not pass them",
+                      DeprecationWarning)
+
+    keys = list(all_params.keys())
+    for combo in itertools.product(*(all_params[key] for key in keys)):
+        yield dict(zip(keys, combo))
 
 class SolverLookup():
+    _base_solvers_cache = None  # built on first base_solvers() call
+    _solver_map_cache = None    # (source list, name->class dict), see _solver_map()
+    _supported_cache = None     # (source list, names), see supported()
+
     @classmethod
     def base_solvers(cls):
         """
@@ -70,18 +97,35 @@ class SolverLookup():
 
             First one is default
         """
-        return [("ortools", CPM_ortools),
-                ("z3", CPM_z3),
-                ("minizinc", CPM_minizinc),
-                ("gcs", CPM_gcs),
-                ("gurobi", CPM_gurobi),
-                ("pysat", CPM_pysat),
-                ("pysdd", CPM_pysdd),
-                ("exact", CPM_exact),
-                ("choco", CPM_choco),
-                ("pumpkin", CPM_pumpkin),
-                ("cpo", CPM_cpo),
+        if cls._base_solvers_cache is None:
+            cls._base_solvers_cache = [
+                ("ortools", _solver_class("CPM_ortools")),
+                ("z3", _solver_class("CPM_z3")),
+                ("minizinc", _solver_class("CPM_minizinc")),
+                ("gcs", _solver_class("CPM_gcs")),
+                ("gurobi", _solver_class("CPM_gurobi")),
+                ("pysat", _solver_class("CPM_pysat")),
+                ("pysdd", _solver_class("CPM_pysdd")),
+                ("exact", _solver_class("CPM_exact")),
+                ("choco", _solver_class("CPM_choco")),
+                ("pumpkin", _solver_class("CPM_pumpkin")),
+                ("cpo", _solver_class("CPM_cpo")),
                ]
+        return cls._base_solvers_cache
+
+    @classmethod
+    def _solver_map(cls):
+        """
+            Name -> class dict over base_solvers(), for O(1) lookup().
+
+            Rebuilt whenever base_solvers() returns a different list object,
+            so code (e.g. tests) that overrides base_solvers keeps working.
+        """
+        base = cls.base_solvers()
+        cached = cls._solver_map_cache
+        if cached is None or cached[0] is not base:
+            cached = cls._solver_map_cache = (base, dict(base))
+        return cached[1]
 
     @classmethod
     def print_status(cls):
@@ -104,17 +148,37 @@ class SolverLookup():
             (e.g. any separate binaries are also installed if necessary, and licenses are active if needed).
 
             Typical use case is to use these names in `SolverLookup.get(name)`.
+
+            The result is cached per process, as the solvers' own `.supported()`
+            may probe packages, binaries or licenses; see
+            :func:`invalidate_supported_cache` to force re-probing.
         """
+        base = cls.base_solvers()
+        cached = cls._supported_cache
+        if cached is not None and cached[0] is base:
+            return list(cached[1])
+
         names = []
-        for (basename, CPM_slv) in cls.base_solvers():
+        for (basename, CPM_slv) in base:
             if CPM_slv.supported():
                 names.append(basename)
                 if hasattr(CPM_slv, "solvernames"):
                     subnames = CPM_slv.solvernames()
                     for subn in subnames:
                         names.append(basename+":"+subn)
+        cls._supported_cache = (base, list(names))
         return names
 
+    @classmethod
+    def invalidate_supported_cache(cls):
+        """
+            Clear the cached results of :func:`supported` (and the derived
+            lookup tables), e.g. after installing a solver in the running
+            process or when test code patches :func:`base_solvers`.
+        """
+        cls._supported_cache = None
+        cls._solver_map_cache = None
+
     @classmethod
     def solvernames(cls):
         # The older (more indirectly named) way to get the list of names of *supported* solvers.
@@ -158,16 +222,13 @@ class SolverLookup():
         if ':' in solvername:
             solvername,_ = solvername.split(':',maxsplit=1)
 
-        for (basename, CPM_slv) in cls.base_solvers():
-            if basename == solvername:
-                # found the right solver
-                return CPM_slv
+        solver_cls = cls._solver_map().get(solvername)
+        if solver_cls is not None:
+            return solver_cls
         raise ValueError(f"Unknown solver '{name}', chose from {cls.solvernames()}")
 
 
-# using `builtin_solvers` is DEPRECATED, use `SolverLookup` object instead
-# Order matters! first is default, then tries second, etc...
-builtin_solvers = [CPM_ortools, CPM_gurobi, CPM_minizinc, CPM_pysat, CPM_exact, CPM_choco]
+# `builtin_solvers` is defined lazily in the module `__getattr__` above
 def get_supported_solvers():
     """
         Returns a list of solvers supported on this machine.
@@ -178,4 +239,7 @@ def get_supported_solvers():
         :return: a list of SolverInterface sub-classes :list[SolverInterface]:
     """
     warnings.warn("Deprecated, use Model.solvernames() instead, will be removed in stable version", DeprecationWarning)
-    return [sv for sv in builtin_solvers if sv.supported()]
+    solvers = globals().get("builtin_solvers")
+    if solvers is None:
+        solvers = __getattr__("builtin_solvers")
+    return [sv for sv in solvers if sv.supported()]
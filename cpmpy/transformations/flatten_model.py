@@ -93,6 +93,7 @@ import builtins
 import cpmpy as cp
 
 from .normalize import toplevel_list, simplify_boolean
+from .get_variables import get_variables
 from ..expressions.core import *
 from ..expressions.core import _wsum_should, _wsum_make
 from ..expressions.variables import _NumVarImpl, _IntVarImpl, _BoolVarImpl
@@ -285,14 +286,17 @@ def flatten_constraint(expr, csemap=None):
     return newlist
 
 
-def flatten_objective(expr, supported=frozenset(["sum", "wsum"]), csemap=None):
+def flatten_objective(expr, supported=frozenset(["sum", "wsum"]), csemap=None, collect=None):
     """
     - Decision variable: Var
-    - Linear: 
+    - Linear:
         ======================                       ========
         sum([Var])                                   (CPMpy class 'Operator', name 'sum')
         wsum([Const],[Var])                          (CPMpy class 'Operator', name 'wsum')
         ======================                       ========
+
+    If `collect` is a set, the variables of the flat objective are added to it,
+    saving the caller a second traversal with `get_variables()`.
     """
     # lets be very explicit here
     if is_any_list(expr):
@@ -301,12 +305,14 @@ def flatten_objective(expr, supported=frozenset(["sum", "wsum"]), csemap=None):
 
     expr = simplify_boolean([expr])[0]
     (flatexpr, flatcons) = normalized_numexpr(expr)  # might rewrite expr into a (w)sum
-    if isinstance(flatexpr, Expression) and flatexpr.name in supported:
-        return (flatexpr, flatcons)
-    else:
+    if not (isinstance(flatexpr, Expression) and flatexpr.name in supported):
         # any other numeric expression,
         var, cons = get_or_make_var(flatexpr, csemap=csemap)
-        return (var, cons+flatcons)
+        (flatexpr, flatcons) = (var, cons+flatcons)
+
+    if collect is not None:
+        get_variables(flatexpr, collect=collect)
+    return (flatexpr, flatcons)
 
 
 def __is_flat_var(arg):
@@ -49,6 +49,36 @@ def toplevel_list(cpm_expr, merge_and=True):
     return newlist
 
 
+def toplevel_iter(cpm_expr, merge_and=True):
+    """
+    Streaming variant of :func:`toplevel_list`: yields the expressions one at a
+    time instead of materializing the full list, so posting a huge nested
+    conjunction does not hold a second copy of it in memory.
+
+    Arguments:
+        cpm_expr:   Expression or list of Expressions
+        merge_and:  if True then a toplevel 'and' will have its arguments merged at top level
+    """
+    def unravel(lst):
+        for e in lst:
+            if isinstance(e, Expression):
+                if isinstance(e, NDVarArray):  # sometimes does not have .name
+                    yield from unravel(e.flat)
+                elif merge_and and e.name == "and":
+                    yield from unravel(e.args)
+                else:
+                    assert (e.is_bool()), f"Only boolean expressions allowed at toplevel, got {e}"
+                    yield e # presumably the most frequent case
+            elif isinstance(e, (list, tuple, np.flatiter, np.ndarray)):
+                yield from unravel(e)
+            elif e is False or e is np.False_:
+                yield BoolVal(e)
+            elif e is not True and e is not np.True_:  # if True: pass
+                raise NotSupportedError(f"Expression {e} is not a valid CPMpy constraint")
+
+    return unravel((cpm_expr,))
+
+
 def simplify_boolean(lst_of_expr, num_context=False):
     """
     Removes boolean constants from all CPMpy expressions.
@@ -26,7 +26,6 @@ Modified by Ignace Bleukx, ignace.bleukx@kuleuven.be
 import argparse
 
 from cpmpy import *
-import numpy as np
 
 
 def all_interval(n=12):
@@ -43,7 +42,9 @@ def all_interval(n=12):
               AllDifferent(diffs)]
 
     # differences between successive values
-    model += diffs == np.abs(x[1:] - x[:-1])
+    # x is a cpm_array, so slicing subtracts in one vectorized step and
+    # builtin abs() skips numpy's per-element ufunc dispatch
+    model += diffs == abs(x[1:] - x[:-1])
 
     # symmetry breaking
     model += [x[0] < x[-1]] # mirroring array is equivalent solution
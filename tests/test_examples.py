@@ -11,6 +11,7 @@ from os.path import join
 from os import getcwd
 import types
 import importlib.machinery
+import unittest.mock as mock
 import pytest
 from cpmpy import *
 
@@ -24,8 +25,26 @@ else:
                glob(join("..", "examples", "advanced", "*.py")) + \
                glob(join("..", "examples", "csplib", "*.py"))
 
+@pytest.fixture(scope="session")
+def gurobi_solver():
+    """Gurobi solver class if usable on this system, else None (probed once per session)"""
+    slv = SolverLookup.lookup("gurobi")
+    return slv if slv.supported() else None
+
+@pytest.fixture(scope="session")
+def minizinc_solver():
+    """MiniZinc solver class if usable on this system, else None (probed once per session)"""
+    slv = SolverLookup.lookup("minizinc")
+    return slv if slv.supported() else None
+
+def _as_default(solvername, solver_cls):
+    """Context manager that temporarily makes (solvername, solver_cls) the default solver"""
+    # a stable list object, so SolverLookup's identity-keyed caches stay valid inside the patch
+    base = [(solvername, solver_cls)] + SolverLookup.base_solvers()
+    return mock.patch.object(SolverLookup, "base_solvers", classmethod(lambda cls: base))
+
 @pytest.mark.parametrize("example", EXAMPLES)
-def test_examples(example):
+def test_examples(example, gurobi_solver, minizinc_solver):
     """Loads example files and executes with default solver
 
 class TestExamples(unittest.TestCase):
@@ -49,26 +68,14 @@ class TestExamples(unittest.TestCase):
     if any(x in example for x in ["npuzzle","tst_likevrp", "ortools_presolve_propagate", 'sudoku_ratrun1.py']):
         # exclude those, too slow or solver specific
         return
-    gbi_slv = SolverLookup.lookup("gurobi")
-    if gbi_slv.supported():
-        # temporarily brute-force overwrite SolverLookup.base_solvers so our solver is default
-        f = SolverLookup.base_solvers
-        try:
-            SolverLookup.base_solvers = lambda: [('gurobi', gbi_slv)]+f()
+    if gurobi_solver is not None:
+        with _as_default('gurobi', gurobi_solver):
             loader.exec_module(mod)
-        finally:
-            SolverLookup.base_solvers = f
 
     # run again with minizinc, if installed on system
     if example in ['./examples/npuzzle.py', './examples/tsp_likevrp.py', './examples/sudoku_ratrun1.py', './examples/sudoku_chockablock.py']:
         # except for these too slow ones
         return
-    mzn_slv = SolverLookup.lookup('minizinc')
-    if mzn_slv.supported():
-        # temporarily brute-force overwrite SolverLookup.base_solvers so our solver is default
-        f = SolverLookup.base_solvers
-        try:
-            SolverLookup.base_solvers = lambda: [('minizinc', mzn_slv)]+f()
+    if minizinc_solver is not None:
+        with _as_default('minizinc', minizinc_solver):
             loader.exec_module(mod)
-        finally:
-            SolverLookup.base_solvers = f